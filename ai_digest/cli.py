@@ -1,25 +1,64 @@
 """Main CLI entry point for AI News Digest."""
 
 import argparse
+import copy
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
-import yaml
-
-from .scraper import fetch_all_feeds
-from .llm import LLMProcessor
 from .digest import generate_digest, print_digest_summary
 
 
+# Keywords used for relevance scoring when LLM processing is skipped
+KEYWORDS = ("ai", "artificial intelligence", "machine learning", "ml", "llm", "neural", "gpt", "claude")
+
+# Parsed config files keyed by resolved path: (mtime, size, config)
+_CONFIG_CACHE: OrderedDict[str, tuple[float, int, dict]] = OrderedDict()
+_CONFIG_CACHE_SIZE = 100
+
+
 def load_config(config_path: str) -> dict:
-    """Load configuration from YAML file."""
+    """
+    Load configuration from YAML file.
+
+    Parsed configs are cached and reused until the file's mtime or size
+    changes. Each call returns a fresh copy, so callers may modify it.
+    """
     path = Path(config_path)
     if not path.exists():
         print(f"Error: Config file not found: {config_path}")
         sys.exit(1)
 
+    key = str(path.resolve())
+    st = path.stat()
+    cached = _CONFIG_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _CONFIG_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    import yaml
+
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        config = yaml.safe_load(f)
+
+    _CONFIG_CACHE[key] = (st.st_mtime, st.st_size, config)
+    _CONFIG_CACHE.move_to_end(key)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+
+    return copy.deepcopy(config)
+
+
+def score_by_keywords(articles: list) -> None:
+    """
+    Set relevance scores from keyword matches, for use without an LLM.
+
+    Each distinct keyword found in the title or description adds 0.2,
+    capped at 1.0.
+    """
+    for article in articles:
+        matches = sum(1 for kw in KEYWORDS if kw in article.search_text)
+        article.relevance_score = min(1.0, matches * 0.2)
 
 
 def run_pipeline(
@@ -27,6 +66,7 @@ def run_pipeline(
     max_articles: int = None,
     skip_llm: bool = False,
     quiet: bool = False,
+    allow_batch: bool = True,
 ) -> list:
     """
     Run the full scrape + LLM pipeline.
@@ -36,10 +76,16 @@ def run_pipeline(
         max_articles: Override for max articles (uses config default if None)
         skip_llm: If True, skip LLM summarization
         quiet: Suppress progress output
+        allow_batch: If False, ignore llm.mode "batch" and use realtime calls
 
     Returns:
         List of processed Article objects with summaries and relevance scores
     """
+    # Deferred so --help, --list-feeds and --web don't pay for these imports
+    import asyncio
+    from .scraper import fetch_all_feeds
+    from .llm import LLMProcessor
+
     digest_config = config.get("digest", {})
     max_articles = max_articles or digest_config.get("max_articles", 20)
     relevance_threshold = digest_config.get("relevance_threshold", 0.3)
@@ -66,17 +112,20 @@ def run_pipeline(
             llm_config = config.get("llm", {})
             processor = LLMProcessor(llm_config)
 
-            for i, article in enumerate(articles, 1):
+            if allow_batch and llm_config.get("mode") == "batch":
                 if not quiet:
-                    print(f"  Processing {i}/{len(articles)}: {article.title[:50]}...")
-
-                summary, relevance = processor.process_article(
-                    article.title,
-                    article.description,
-                    topic
-                )
-                article.summary = summary
-                article.relevance_score = relevance
+                    print(f"  Submitting {len(articles)} articles as a batch job (this may take a while)...")
+                processor.process_articles_batch(articles, topic)
+            else:
+                concurrency = llm_config.get("concurrency", 16)
+                if not quiet:
+                    print(f"  Processing {len(articles)} articles ({concurrency} concurrent requests)...")
+                asyncio.run(processor.process_articles_async(
+                    articles,
+                    topic,
+                    concurrency=concurrency,
+                    progress=not quiet,
+                ))
 
         except ValueError as e:
             if not quiet:
@@ -85,11 +134,7 @@ def run_pipeline(
     else:
         if not quiet:
             print("\n[2/3] Skipping LLM processing (--no-summary flag)")
-        for article in articles:
-            text = (article.title + " " + article.description).lower()
-            keywords = ["ai", "artificial intelligence", "machine learning", "ml", "llm", "neural", "gpt", "claude"]
-            matches = sum(1 for kw in keywords if kw in text)
-            article.relevance_score = min(1.0, matches * 0.2)
+        score_by_keywords(articles)
 
     # Step 3: Filter
     if not skip_llm:
@@ -1,10 +1,11 @@
 """Markdown digest generator module."""
 
-import json
 import os
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 from .scraper import Article
 
 
@@ -33,15 +34,22 @@ def save_digest_json(
     topic: str,
     output_dir: str = "./digests"
 ) -> str:
-    """Save article data as JSON for web UI consumption."""
+    """
+    Save article data as JSON for web UI consumption.
+
+    Also writes a small digest_<date>.meta.json sidecar with the topic and
+    article count, so the web UI can list digests without parsing them.
+    """
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     date_str = datetime.now().strftime("%Y-%m-%d")
     filepath = os.path.join(output_dir, f"digest_{date_str}.json")
+    meta_path = os.path.join(output_dir, f"digest_{date_str}.meta.json")
+    generated = datetime.now().isoformat()
 
     data = {
         "date": date_str,
         "topic": topic,
-        "generated": datetime.now().isoformat(),
+        "generated": generated,
         "articles": [
             {
                 "title": a.title,
@@ -56,8 +64,16 @@ def save_digest_json(
         ],
     }
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+    meta = {
+        "topic": topic,
+        "article_count": len(articles),
+        "generated": generated,
+    }
+    with open(meta_path, "wb") as f:
+        f.write(orjson.dumps(meta))
 
     return filepath
 
@@ -1,20 +1,197 @@
 """LLM integration module for summarization and relevance ranking."""
 
+import asyncio
 import os
-import json
-from typing import Optional
+import re
+import threading
+import time
+from hashlib import blake2b
+from typing import Callable, Optional
+
+import orjson
+
+# Retry policy for rate-limited or transiently failing async requests
+RETRY_ATTEMPTS = 6
+RETRY_MAX_WAIT = 60
+
+# Connection settings shared by all provider HTTP clients
+HTTP_TIMEOUT = 30.0
+HTTP_MAX_CONNECTIONS = 64
+
+# Persistent cache of (summary, relevance) results across runs
+LLM_CACHE_DIR = ".cache/llm"
+LLM_CACHE_TTL = 7 * 86400
+
+# Anthropic responses are prefilled with this so the model continues a JSON object
+ANTHROPIC_PREFILL = "{"
+
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Get the on-disk LLM result cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from diskcache import Cache
+            _cache = Cache(LLM_CACHE_DIR)
+    return _cache
+
+
+def _http_client_kwargs(sdk) -> dict:
+    """
+    Keyword arguments for an SDK's Default(Async)HttpxClient.
+
+    Enables pooled HTTP/2 while keeping the SDK's other client defaults.
+    Limits is built from the SDK's own constant, since newer SDK releases
+    ship their own httpx package and reject objects from ours.
+    """
+    limits_cls = type(sdk.DEFAULT_CONNECTION_LIMITS)
+    return {
+        "http2": True,
+        "limits": limits_cls(max_connections=HTTP_MAX_CONNECTIONS),
+        "timeout": HTTP_TIMEOUT,
+    }
 
 
 def get_openai_client(api_key: str):
     """Get OpenAI client."""
-    from openai import OpenAI
-    return OpenAI(api_key=api_key)
+    import openai
+    return openai.OpenAI(
+        api_key=api_key,
+        http_client=openai.DefaultHttpxClient(**_http_client_kwargs(openai)),
+    )
 
 
 def get_anthropic_client(api_key: str):
     """Get Anthropic client."""
-    from anthropic import Anthropic
-    return Anthropic(api_key=api_key)
+    import anthropic
+    return anthropic.Anthropic(
+        api_key=api_key,
+        http_client=anthropic.DefaultHttpxClient(**_http_client_kwargs(anthropic)),
+    )
+
+
+def get_async_openai_client(api_key: str):
+    """Get async OpenAI client (retries are handled by _retrying)."""
+    import openai
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        max_retries=0,
+        http_client=openai.DefaultAsyncHttpxClient(**_http_client_kwargs(openai)),
+    )
+
+
+def get_async_anthropic_client(api_key: str):
+    """Get async Anthropic client (retries are handled by _retrying)."""
+    import anthropic
+    return anthropic.AsyncAnthropic(
+        api_key=api_key,
+        max_retries=0,
+        http_client=anthropic.DefaultAsyncHttpxClient(**_http_client_kwargs(anthropic)),
+    )
+
+
+def _openai_retryable_errors() -> tuple:
+    """OpenAI errors worth retrying: rate limits, connection and server errors."""
+    import openai
+    return (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+
+def _anthropic_retryable_errors() -> tuple:
+    """Anthropic errors worth retrying: rate limits, connection and server errors."""
+    import anthropic
+    return (anthropic.RateLimitError, anthropic.APIConnectionError, anthropic.InternalServerError)
+
+
+def _retrying(errors: tuple):
+    """Build an async retry policy with jittered exponential backoff."""
+    from tenacity import (
+        AsyncRetrying,
+        retry_if_exception_type,
+        stop_after_attempt,
+        wait_random_exponential,
+    )
+    return AsyncRetrying(
+        wait=wait_random_exponential(multiplier=1, max=RETRY_MAX_WAIT),
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        retry=retry_if_exception_type(errors),
+        reraise=True,
+    )
+
+
+def _openai_prompt(title: str, description: str, topic: str) -> str:
+    """Build the summarize-and-rank prompt for OpenAI models."""
+    return f"""Analyze this article and provide:
+1. A concise 2-3 sentence summary
+2. A relevance score from 0.0 to 1.0 for the topic "{topic}"
+
+Article Title: {title}
+Article Description: {description}
+
+Respond in JSON format:
+{{"summary": "your summary here", "relevance": 0.8}}"""
+
+
+def _anthropic_prompt(title: str, description: str, topic: str) -> str:
+    """Build the summarize-and-rank prompt for Anthropic models."""
+    return f"""Analyze this article and provide:
+1. A concise 2-3 sentence summary
+2. A relevance score from 0.0 to 1.0 for the topic "{topic}"
+
+Article Title: {title}
+Article Description: {description}
+
+Respond in JSON format only, no other text:
+{{"summary": "your summary here", "relevance": 0.8}}"""
+
+
+def _openai_request(model: str, prompt: str) -> dict:
+    """Build keyword arguments for an OpenAI chat completion request."""
+    return {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.3,
+        "max_tokens": 300,
+        "response_format": {"type": "json_object"},
+    }
+
+
+def _anthropic_request(model: str, prompt: str) -> dict:
+    """Build keyword arguments for an Anthropic messages request."""
+    return {
+        "model": model,
+        "max_tokens": 300,
+        "messages": [
+            {"role": "user", "content": prompt},
+            {"role": "assistant", "content": ANTHROPIC_PREFILL},
+        ],
+    }
+
+
+def _parse_response(content: str) -> tuple[str, float]:
+    """
+    Parse an LLM response into a summary and clamped relevance score.
+
+    Returns:
+        Tuple of (summary, relevance_score)
+    """
+    try:
+        result = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # Fall back to a JSON object wrapped in a markdown code fence
+        match = _FENCED_JSON_RE.search(content)
+        if not match:
+            raise
+        result = orjson.loads(match.group(1))
+    summary = result.get("summary", "")
+    relevance = float(result.get("relevance", 0.0))
+    relevance = max(0.0, min(1.0, relevance))
+
+    return summary, relevance
 
 
 def summarize_and_rank_openai(
@@ -30,37 +207,14 @@ def summarize_and_rank_openai(
     Returns:
         Tuple of (summary, relevance_score)
     """
-    prompt = f"""Analyze this article and provide:
-1. A concise 2-3 sentence summary
-2. A relevance score from 0.0 to 1.0 for the topic "{topic}"
-
-Article Title: {title}
-Article Description: {description}
-
-Respond in JSON format:
-{{"summary": "your summary here", "relevance": 0.8}}"""
+    prompt = _openai_prompt(title, description, topic)
 
     try:
         response = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
-            max_tokens=300
+            **_openai_request(model, prompt)
         )
 
-        content = response.choices[0].message.content.strip()
-        # Extract JSON from response
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        result = json.loads(content)
-        summary = result.get("summary", "")
-        relevance = float(result.get("relevance", 0.0))
-        relevance = max(0.0, min(1.0, relevance))
-
-        return summary, relevance
+        return _parse_response(response.choices[0].message.content)
 
     except Exception as e:
         print(f"    Error in OpenAI call: {e}")
@@ -80,39 +234,83 @@ def summarize_and_rank_anthropic(
     Returns:
         Tuple of (summary, relevance_score)
     """
-    prompt = f"""Analyze this article and provide:
-1. A concise 2-3 sentence summary
-2. A relevance score from 0.0 to 1.0 for the topic "{topic}"
-
-Article Title: {title}
-Article Description: {description}
-
-Respond in JSON format only, no other text:
-{{"summary": "your summary here", "relevance": 0.8}}"""
+    prompt = _anthropic_prompt(title, description, topic)
 
     try:
         response = client.messages.create(
-            model=model,
-            max_tokens=300,
-            messages=[{"role": "user", "content": prompt}]
+            **_anthropic_request(model, prompt)
         )
 
-        content = response.content[0].text.strip()
-        # Extract JSON from response
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
+        return _parse_response(ANTHROPIC_PREFILL + response.content[0].text)
 
-        result = json.loads(content)
-        summary = result.get("summary", "")
-        relevance = float(result.get("relevance", 0.0))
-        relevance = max(0.0, min(1.0, relevance))
+    except Exception as e:
+        print(f"    Error in Anthropic call: {e}")
+        return "", 0.0
 
-        return summary, relevance
+
+async def summarize_and_rank_openai_async(
+    client,
+    model: str,
+    title: str,
+    description: str,
+    topic: str,
+    log: Callable[[str], None] = print
+) -> tuple[str, float]:
+    """
+    Summarize article and calculate relevance using the async OpenAI client.
+
+    Errors are reported through ``log``, e.g. ``tqdm.write`` while a
+    progress bar is active.
+
+    Returns:
+        Tuple of (summary, relevance_score)
+    """
+    prompt = _openai_prompt(title, description, topic)
+
+    try:
+        async for attempt in _retrying(_openai_retryable_errors()):
+            with attempt:
+                response = await client.chat.completions.create(
+                    **_openai_request(model, prompt)
+                )
+
+        return _parse_response(response.choices[0].message.content)
 
     except Exception as e:
-        print(f"    Error in Anthropic call: {e}")
+        log(f"    Error in OpenAI call: {e}")
+        return "", 0.0
+
+
+async def summarize_and_rank_anthropic_async(
+    client,
+    model: str,
+    title: str,
+    description: str,
+    topic: str,
+    log: Callable[[str], None] = print
+) -> tuple[str, float]:
+    """
+    Summarize article and calculate relevance using the async Anthropic client.
+
+    Errors are reported through ``log``, e.g. ``tqdm.write`` while a
+    progress bar is active.
+
+    Returns:
+        Tuple of (summary, relevance_score)
+    """
+    prompt = _anthropic_prompt(title, description, topic)
+
+    try:
+        async for attempt in _retrying(_anthropic_retryable_errors()):
+            with attempt:
+                response = await client.messages.create(
+                    **_anthropic_request(model, prompt)
+                )
+
+        return _parse_response(ANTHROPIC_PREFILL + response.content[0].text)
+
+    except Exception as e:
+        log(f"    Error in Anthropic call: {e}")
         return "", 0.0
 
 
@@ -130,6 +328,10 @@ class LLMProcessor:
         self.model = config.get("model", "gpt-4o-mini")
         api_key_env = config.get("api_key_env", "OPENAI_API_KEY")
 
+        self.batch_poll_interval = config.get("batch_poll_interval", 30)
+        self.batch_max_wait = config.get("batch_max_wait", 3600)
+        self.use_cache = config.get("cache", True)
+
         self.api_key = os.environ.get(api_key_env)
         if not self.api_key:
             raise ValueError(
@@ -149,6 +351,50 @@ class LLMProcessor:
                 raise ValueError(f"Unknown LLM provider: {self.provider}")
         return self.client
 
+    def _cache_key(self, title: str, description: str, topic: str) -> str:
+        """Build the cache key for an article under this provider and model."""
+        parts = (self.provider, self.model, topic, title, description)
+        return blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _open_cache(self):
+        """Return the result cache, or None if caching is off or unavailable."""
+        if not self.use_cache:
+            return None
+        try:
+            return get_cache()
+        except Exception as e:
+            self._disable_cache(e)
+            return None
+
+    def _disable_cache(self, error: Exception) -> None:
+        """Turn caching off after an error so it never blocks LLM calls."""
+        if self.use_cache:
+            self.use_cache = False
+            print(f"    LLM cache unavailable, continuing without it: {error}")
+
+    def _cache_get(self, key: str) -> Optional[tuple[str, float]]:
+        """Return a cached (summary, relevance) result, if any."""
+        cache = self._open_cache()
+        if cache is None:
+            return None
+        try:
+            return cache.get(key)
+        except Exception as e:
+            self._disable_cache(e)
+            return None
+
+    def _cache_set(self, key: str, result: tuple[str, float]) -> None:
+        """Store a result; failed calls (empty summary) are not cached."""
+        if not result[0]:
+            return
+        cache = self._open_cache()
+        if cache is None:
+            return
+        try:
+            cache.set(key, result, expire=LLM_CACHE_TTL)
+        except Exception as e:
+            self._disable_cache(e)
+
     def process_article(
         self,
         title: str,
@@ -166,18 +412,244 @@ class LLMProcessor:
         Returns:
             Tuple of (summary, relevance_score)
         """
+        key = self._cache_key(title, description, topic)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         client = self._get_client()
 
         # Use description or title if description is empty
         text = description if description else title
 
         if self.provider == "openai":
-            return summarize_and_rank_openai(
+            result = summarize_and_rank_openai(
                 client, self.model, title, text, topic
             )
         elif self.provider == "anthropic":
-            return summarize_and_rank_anthropic(
+            result = summarize_and_rank_anthropic(
                 client, self.model, title, text, topic
             )
         else:
             return "", 0.0
+
+        self._cache_set(key, result)
+        return result
+
+    async def process_articles_async(
+        self,
+        articles: list,
+        topic: str,
+        concurrency: int = 16,
+        progress: bool = False
+    ) -> list:
+        """
+        Summarize and score many articles concurrently.
+
+        At most ``concurrency`` requests are in flight at once. Results are
+        written onto each article's ``summary`` and ``relevance_score``.
+
+        Args:
+            articles: List of Article objects to process
+            topic: Topic for relevance scoring
+            concurrency: Maximum number of simultaneous API requests
+            progress: Show a progress bar as articles complete
+
+        Returns:
+            The same list of articles, updated in place
+        """
+        if self.provider == "openai":
+            client = get_async_openai_client(self.api_key)
+            summarize = summarize_and_rank_openai_async
+        elif self.provider == "anthropic":
+            client = get_async_anthropic_client(self.api_key)
+            summarize = summarize_and_rank_anthropic_async
+        else:
+            raise ValueError(f"Unknown LLM provider: {self.provider}")
+
+        from tqdm import tqdm
+
+        # Open the cache before the progress bar starts, so any warning
+        # about it being unavailable is printed cleanly
+        self._open_cache()
+
+        sem = asyncio.Semaphore(max(1, concurrency))
+        bar = tqdm(total=len(articles), disable=not progress, unit="article")
+        # Keep error output from tearing through the progress bar
+        log = tqdm.write if progress else print
+
+        async def process_one(article):
+            key = self._cache_key(article.title, article.description, topic)
+            # Use description or title if description is empty
+            text = article.description if article.description else article.title
+            try:
+                result = self._cache_get(key)
+                if result is None:
+                    async with sem:
+                        result = await summarize(
+                            client, self.model, article.title, text, topic, log
+                        )
+                    self._cache_set(key, result)
+                article.summary, article.relevance_score = result
+            finally:
+                bar.update(1)
+
+        try:
+            tasks = [process_one(article) for article in articles]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for article, result in zip(articles, results):
+                if isinstance(result, BaseException):
+                    log(f"    Error processing {article.title[:50]}: {result!r}")
+        finally:
+            bar.close()
+            await client.close()
+
+        return articles
+
+    def process_articles_batch(self, articles: list, topic: str) -> list:
+        """
+        Summarize and score articles through the provider's Batch API.
+
+        All prompts are submitted as a single batch job, which is billed at
+        a discount but may take a while to complete. Blocks until the batch
+        finishes, polling every ``batch_poll_interval`` seconds; a batch still
+        running after ``batch_max_wait`` seconds is cancelled.
+
+        Args:
+            articles: List of Article objects to process
+            topic: Topic for relevance scoring
+
+        Returns:
+            The same list of articles, updated in place
+        """
+        # Article links may be long or contain characters that batch IDs
+        # reject, so requests are keyed by position instead
+        by_id = {}
+        keys = {}
+        for i, article in enumerate(articles):
+            key = self._cache_key(article.title, article.description, topic)
+            cached = self._cache_get(key)
+            if cached is not None:
+                article.summary, article.relevance_score = cached
+            else:
+                by_id[f"article-{i}"] = article
+                keys[f"article-{i}"] = key
+
+        if not by_id:
+            return articles
+
+        client = self._get_client()
+
+        try:
+            if self.provider == "openai":
+                results = self._run_openai_batch(client, by_id, topic)
+            else:
+                results = self._run_anthropic_batch(client, by_id, topic)
+        except Exception as e:
+            print(f"    Error in batch processing: {e}")
+            results = {}
+
+        for custom_id, (summary, relevance) in results.items():
+            article = by_id.get(custom_id)
+            if article is not None:
+                article.summary = summary
+                article.relevance_score = relevance
+                self._cache_set(keys[custom_id], (summary, relevance))
+
+        return articles
+
+    def _run_openai_batch(
+        self,
+        client,
+        by_id: dict,
+        topic: str
+    ) -> dict[str, tuple[str, float]]:
+        """Submit an OpenAI batch job and collect its parsed results."""
+        lines = []
+        for custom_id, article in by_id.items():
+            text = article.description if article.description else article.title
+            prompt = _openai_prompt(article.title, text, topic)
+            lines.append(orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": _openai_request(self.model, prompt),
+            }))
+
+        batch_file = client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        deadline = time.monotonic() + self.batch_max_wait
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() >= deadline:
+                client.batches.cancel(batch.id)
+                print(f"    Batch {batch.id} not finished after {self.batch_max_wait}s, cancelled")
+                return {}
+            time.sleep(self.batch_poll_interval)
+            batch = client.batches.retrieve(batch.id)
+
+        results = {}
+        if not batch.output_file_id:
+            print(f"    Batch {batch.id} finished with status: {batch.status}")
+            return results
+
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = orjson.loads(line)
+                body = item["response"]["body"]
+                content = body["choices"][0]["message"]["content"]
+                results[item["custom_id"]] = _parse_response(content)
+            except Exception as e:
+                print(f"    Error in OpenAI batch result: {e}")
+
+        return results
+
+    def _run_anthropic_batch(
+        self,
+        client,
+        by_id: dict,
+        topic: str
+    ) -> dict[str, tuple[str, float]]:
+        """Submit an Anthropic message batch and collect its parsed results."""
+        requests = []
+        for custom_id, article in by_id.items():
+            text = article.description if article.description else article.title
+            prompt = _anthropic_prompt(article.title, text, topic)
+            requests.append({
+                "custom_id": custom_id,
+                "params": _anthropic_request(self.model, prompt),
+            })
+
+        batch = client.messages.batches.create(requests=requests)
+
+        deadline = time.monotonic() + self.batch_max_wait
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                client.messages.batches.cancel(batch.id)
+                print(f"    Batch {batch.id} not finished after {self.batch_max_wait}s, cancelled")
+                return {}
+            time.sleep(self.batch_poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        results = {}
+        for item in client.messages.batches.results(batch.id):
+            if item.result.type != "succeeded":
+                print(f"    Anthropic batch request {item.custom_id}: {item.result.type}")
+                continue
+            try:
+                content = ANTHROPIC_PREFILL + item.result.message.content[0].text
+                results[item.custom_id] = _parse_response(content)
+            except Exception as e:
+                print(f"    Error in Anthropic batch result: {e}")
+
+        return results
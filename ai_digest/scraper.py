@@ -1,14 +1,37 @@
 """RSS feed scraper module."""
 
-import feedparser
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from typing import Optional
 import html
 import re
+import threading
 
 
-@dataclass
+# Upper bound on feeds fetched in parallel
+MAX_FETCH_WORKERS = 32
+
+# HTTP settings for feed requests
+FETCH_TIMEOUT = 10
+USER_AGENT = "ai-digest/1.0"
+FEED_CACHE_DIR = ".cache/feeds"
+
+# Minimum length of HTML worth handing to lxml instead of the regexes
+LXML_MIN_LENGTH = 500
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# lxml.html module once imported, False if it is not installed
+_lxml_html = None
+
+_session = None
+_session_lock = threading.Lock()
+
+
+@dataclass(slots=True, eq=False)
 class Article:
     """Represents a single article from an RSS feed."""
     title: str
@@ -18,6 +41,11 @@ class Article:
     description: str
     summary: str = ""
     relevance_score: float = 0.0
+    # Lowercased "title description", precomputed for keyword scoring
+    search_text: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self):
+        self.search_text = (self.title + " " + self.description).lower()
 
     def __hash__(self):
         return hash(self.link)
@@ -28,14 +56,64 @@ class Article:
         return False
 
 
+def _get_lxml_html():
+    """Import lxml.html on first use; returns False if lxml is not installed."""
+    global _lxml_html
+    if _lxml_html is None:
+        try:
+            import lxml.html
+            _lxml_html = lxml.html
+        except ImportError:
+            _lxml_html = False
+    return _lxml_html
+
+
 def clean_html(raw_html: str) -> str:
     """Remove HTML tags and decode entities from text."""
-    clean = re.sub(r'<[^>]+>', '', raw_html)
+    # Long markup-heavy bodies are parsed in C by lxml when it is installed
+    if len(raw_html) > LXML_MIN_LENGTH and '<' in raw_html:
+        lxml_html = _get_lxml_html()
+        if lxml_html:
+            try:
+                text = lxml_html.fromstring(raw_html).text_content()
+                return _WS_RE.sub(' ', text).strip()
+            except Exception:
+                pass
+
+    clean = _TAG_RE.sub('', raw_html)
     clean = html.unescape(clean)
-    clean = re.sub(r'\s+', ' ', clean).strip()
+    clean = _WS_RE.sub(' ', clean).strip()
     return clean
 
 
+def get_session():
+    """
+    Get the shared HTTP session used for feed requests.
+
+    The session pools connections across feeds and keeps an on-disk HTTP
+    cache, so unchanged feeds are revalidated with ETag/Last-Modified
+    instead of being downloaded again.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from cachecontrol import CacheControlAdapter
+            from cachecontrol.caches.file_cache import FileCache
+
+            session = requests.Session()
+            session.headers["User-Agent"] = USER_AGENT
+            adapter = CacheControlAdapter(
+                cache=FileCache(FEED_CACHE_DIR),
+                pool_connections=MAX_FETCH_WORKERS,
+                pool_maxsize=MAX_FETCH_WORKERS,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+    return _session
+
+
 def parse_date(entry: dict) -> Optional[datetime]:
     """Parse publication date from feed entry."""
     if hasattr(entry, 'published_parsed') and entry.published_parsed:
@@ -63,10 +141,19 @@ def fetch_feed(url: str, source_name: str, max_entries: int = 50) -> list[Articl
     Returns:
         List of Article objects
     """
+    import feedparser
+
     articles = []
 
     try:
-        feed = feedparser.parse(url)
+        response = get_session().get(url, timeout=FETCH_TIMEOUT)
+        response.raise_for_status()
+
+        # Content-Location lets feedparser resolve relative links
+        headers = {"content-location": response.url}
+        if "content-type" in response.headers:
+            headers["content-type"] = response.headers["content-type"]
+        feed = feedparser.parse(response.content, response_headers=headers)
 
         if feed.bozo and not feed.entries:
             print(f"  Warning: Could not parse feed from {source_name}: {feed.bozo_exception}")
@@ -115,9 +202,7 @@ def fetch_all_feeds(feeds_config: list[dict]) -> list[Article]:
     Returns:
         Deduplicated list of Article objects
     """
-    all_articles = []
-    seen_links = set()
-
+    enabled = []
     for feed in feeds_config:
         if not feed.get('enabled', True):
             continue
@@ -129,17 +214,23 @@ def fetch_all_feeds(feeds_config: list[dict]) -> list[Article]:
             continue
 
         print(f"  Fetching: {name}")
-        articles = fetch_feed(url, name)
+        enabled.append((name, url))
+
+    if not enabled:
+        return []
+
+    # Feeds are fetched concurrently; results keep config order
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(enabled))) as executor:
+        results = list(executor.map(lambda feed: fetch_feed(feed[1], feed[0]), enabled))
 
+    # Keep the first article seen for each link
+    by_link: dict[str, Article] = {}
+    for articles in results:
         for article in articles:
-            if article.link not in seen_links:
-                seen_links.add(article.link)
-                all_articles.append(article)
+            by_link.setdefault(article.link, article)
 
-    # Sort by publication date (newest first)
-    all_articles.sort(
-        key=lambda x: x.published or datetime.min,
-        reverse=True
-    )
+    # Sort by publication date (newest first), computing each key once
+    decorated = [(a.published or datetime.min, a) for a in by_link.values()]
+    decorated.sort(key=itemgetter(0), reverse=True)
 
-    return all_articles
+    return [a for _, a in decorated]
@@ -1,27 +1,40 @@
 """Web UI for AI News Digest."""
 
-import json
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-from flask import Flask, render_template, request, redirect, url_for, flash
+import orjson
 
 from .cli import load_config, run_pipeline
 from .digest import generate_digest, group_articles
 from .scraper import Article
 
+if TYPE_CHECKING:
+    from flask import Flask
 
-def create_app(config_path: str = "config.yaml") -> Flask:
+# Loaded digests keyed by path: (mtime, topic, articles)
+_DIGEST_CACHE: dict[str, tuple[float, str, list[Article]]] = {}
+# Index page entries keyed by path: (mtime, {"topic", "article_count"})
+_SUMMARY_CACHE: dict[str, tuple[float, dict]] = {}
+
+
+def create_app(config_path: str = "config.yaml") -> "Flask":
     """Create and configure the Flask application."""
+    from flask import Flask, render_template, request, redirect, url_for, flash
+
     app = Flask(__name__)
     app.secret_key = os.urandom(24)
 
-    config = load_config(config_path)
+    # Fail fast on a missing config; routes re-read it per request (cached
+    # by mtime in load_config), so edits apply without a restart
+    load_config(config_path)
 
     @app.route("/")
     def index():
         """Home page: list available digests."""
+        config = load_config(config_path)
         output_dir = config.get("digest", {}).get("output_dir", "./digests")
         digests = _list_digests(output_dir)
         feeds = config.get("feeds", [])
@@ -35,22 +48,21 @@ def create_app(config_path: str = "config.yaml") -> Flask:
     @app.route("/digest/<date>")
     def view_digest(date: str):
         """View a specific digest by date."""
+        config = load_config(config_path)
         output_dir = config.get("digest", {}).get("output_dir", "./digests")
         json_path = os.path.join(output_dir, f"digest_{date}.json")
 
-        if not os.path.exists(json_path):
+        digest = _load_digest(json_path)
+        if digest is None:
             flash(f"Digest for {date} not found.")
             return redirect(url_for("index"))
 
-        with open(json_path, "r") as f:
-            data = json.load(f)
-
-        articles = _articles_from_json(data["articles"])
+        topic, articles = digest
         groups = group_articles(articles)
         return render_template(
             "digest.html",
             date=date,
-            topic=data.get("topic", ""),
+            topic=topic,
             groups=groups,
             total=len(articles),
         )
@@ -58,8 +70,12 @@ def create_app(config_path: str = "config.yaml") -> Flask:
     @app.route("/generate", methods=["POST"])
     def generate():
         """Trigger new digest generation."""
+        config = load_config(config_path)
         skip_llm = "skip_llm" in request.form
-        articles = run_pipeline(config, skip_llm=skip_llm, quiet=True)
+        # Batch jobs can take hours, so requests always use realtime calls
+        articles = run_pipeline(
+            config, skip_llm=skip_llm, quiet=True, allow_batch=False
+        )
 
         if not articles:
             flash("No articles found. Check your feed configuration.")
@@ -76,6 +92,7 @@ def create_app(config_path: str = "config.yaml") -> Flask:
     @app.route("/feeds")
     def feeds():
         """View configured RSS feeds."""
+        config = load_config(config_path)
         feed_list = config.get("feeds", [])
         return render_template("feeds.html", feeds=feed_list)
 
@@ -90,17 +107,59 @@ def _list_digests(output_dir: str) -> list[dict]:
         return digests
 
     for json_file in sorted(path.glob("digest_*.json"), reverse=True):
+        if json_file.name.endswith(".meta.json"):
+            continue
         date = json_file.stem.replace("digest_", "")
-        with open(json_file, "r") as f:
-            data = json.load(f)
-        digests.append({
-            "date": date,
-            "topic": data.get("topic", ""),
-            "article_count": len(data.get("articles", [])),
-        })
+
+        # Prefer the metadata sidecar; older digests only have the full file
+        meta_file = json_file.with_name(f"digest_{date}.meta.json")
+        source = meta_file if meta_file.exists() else json_file
+
+        key = str(source)
+        mtime = source.stat().st_mtime
+        cached = _SUMMARY_CACHE.get(key)
+        if cached and cached[0] == mtime:
+            summary = cached[1]
+        else:
+            with open(source, "rb") as f:
+                data = orjson.loads(f.read())
+            if source is meta_file:
+                article_count = data.get("article_count", 0)
+            else:
+                article_count = len(data.get("articles", []))
+            summary = {
+                "topic": data.get("topic", ""),
+                "article_count": article_count,
+            }
+            _SUMMARY_CACHE[key] = (mtime, summary)
+        digests.append({"date": date, **summary})
     return digests
 
 
+def _load_digest(json_path: str) -> Optional[tuple[str, list[Article]]]:
+    """
+    Load a digest's topic and Article objects, or None if the file is missing.
+
+    Results are reused until the file's mtime changes, so callers must
+    treat the returned list as read-only.
+    """
+    try:
+        mtime = os.stat(json_path).st_mtime
+    except FileNotFoundError:
+        return None
+
+    cached = _DIGEST_CACHE.get(json_path)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    with open(json_path, "rb") as f:
+        data = orjson.loads(f.read())
+    topic = data.get("topic", "")
+    articles = _articles_from_json(data["articles"])
+    _DIGEST_CACHE[json_path] = (mtime, topic, articles)
+    return topic, articles
+
+
 def _articles_from_json(articles_data: list[dict]) -> list[Article]:
     """Reconstruct Article objects from JSON data."""
     articles = []